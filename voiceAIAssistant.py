@@ -1,53 +1,798 @@
 import speech_recognition as sr
 import pyttsx3
-from openai import OpenAI
+import pygame
+import numpy as np
+from sklearn.decomposition import PCA
+from openai import OpenAI, AsyncOpenAI
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter, Retry
+import asyncio
+import collections
+import functools
+import hashlib
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import random
+import re
+import subprocess
+import sys
+import threading
 import time
 import webbrowser
+from urllib.parse import quote_plus
 from dotenv import load_dotenv
 
+# Optional local speech recognition: avoids the cloud ASR round-trip when a
+# local model is available. faster-whisper (int8 CTranslate2 Whisper) is
+# preferred for accuracy; Vosk is the lighter fallback.
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+try:
+    import vosk
+except ImportError:
+    vosk = None
+
 # Configure logging for debugging and monitoring
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
+logger = logging.getLogger(__name__)
+
+
+def _setup_queue_logging():
+    """
+    Move log writing off the calling threads.
+
+    Each logging call normally writes to the stream under the handler lock,
+    so slow console I/O stalls whichever thread logged — including the
+    voice loop. Swapping the root handlers for a QueueHandler makes logging
+    a lock-free enqueue; a QueueListener thread does the actual writing.
+
+    Returns:
+        logging.handlers.QueueListener: Started listener (stop() on shutdown)
+    """
+    root = logging.getLogger()
+    listener = logging.handlers.QueueListener(
+        queue.SimpleQueue(), *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(listener.queue)]
+    listener.start()
+    return listener
 
 # Load environment variables
 load_dotenv()
 OPENAI_KEY = os.getenv("OPENAI_API_KEY")
 WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
 
-# OpenAI configuration
+# OpenAI configuration. Generation latency is roughly linear in output
+# tokens, and the system prompt already asks for 1-3 sentences, so the
+# token cap matches that budget instead of paying for 500-token headroom
 GPT_MODEL = 'gpt-4o-mini'
-MAX_TOKENS = 500
+MAX_TOKENS = 120
 TEMPERATURE = 0.15
 
+# Stop sequences: a blank line or a fabricated next turn means the spoken
+# answer is complete, so cut generation there
+COMPLETION_STOP = ["\n\nUser:", "\n\n"]
+
+# Audio capture bounds: phrases are capped so a single capture can never
+# hold more than ~30s of PCM, and local ASR is fed in 100ms frames
+MAX_PHRASE_SECONDS = 30
+ASR_SAMPLE_RATE = 16000
+ASR_CHUNK_BYTES = 3200  # 100ms of 16kHz 16-bit mono
+
+# Semantic cache configuration
+EMBEDDING_MODEL = 'text-embedding-3-small'
+EMBEDDING_DIM = 1536
+CACHE_SIMILARITY_THRESHOLD = 0.92
+PCA_COMPONENTS = 128  # Compressed search dimensionality
+EMBED_BATCH_SIZE = 8  # Pending entries that trigger an immediate flush
+EMBED_FLUSH_DELAY = 0.2  # Debounce (seconds) before flushing a partial batch
+CACHE_MAX_ENTRIES = 500  # Least-recently-hit entries are evicted past this
+
+# Cache size at which compression kicks in. Must sit below CACHE_MAX_ENTRIES
+# (eviction runs before the refit check, so the size never exceeds the cap);
+# the doubling refit schedule naturally stops once it passes the cap
+PCA_MIN_ENTRIES = 256
+
 # Initialize OpenAI client
 if not OPENAI_KEY:
     raise ValueError("OPENAI_API_KEY environment variable is required")
 
-client = OpenAI(api_key=OPENAI_KEY)
+# HTTP/2 multiplexing plus a keepalive pool shaves per-call connection
+# overhead off the chat and embedding requests made every turn
+client = OpenAI(
+    api_key=OPENAI_KEY,
+    http_client=httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+        timeout=httpx.Timeout(connect=3.0, read=30.0, write=10.0, pool=5.0)
+    )
+)
+
+# Async client used on the event loop for streamed completions, so tokens
+# are consumed without tying up a worker thread
+aclient = AsyncOpenAI(
+    api_key=OPENAI_KEY,
+    http_client=httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+        timeout=httpx.Timeout(connect=3.0, read=30.0, write=10.0, pool=5.0)
+    )
+)
+
+# System prompt defining AI personality and behavior. The text lives in one
+# triple-quoted constant with no interpolation so the bytes sent to the API
+# are identical every turn; provider-side prefix caching requires a
+# byte-stable prefix to hit. Dynamic per-turn context must never be injected
+# here; add it as a separate later message instead.
+_SYSTEM_PROMPT_TEXT = """You are a friendly, helpful, and conversational voice assistant.
+
+                Key traits:
+                - Be natural and conversational, like talking to a friend
+                - Keep responses concise but informative (1-3 sentences usually)
+                - Show personality and enthusiasm when appropriate
+                - Ask follow-up questions to keep conversation flowing
+                - Be helpful with any topic: science, history, math, advice, entertainment, etc.
+                - If you don't know something recent, acknowledge it but still try to help
+                - Remember the conversation context from previous messages
+                - Be encouraging and positive
+                - Always provide a meaningful response
+                - Respond naturally as if you're having a real conversation
+                - Avoid overly long responses since this is voice-based interaction"""
+
+# Built exactly once at import and always sent as the same object at index 0
+# of the messages array
+SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT_TEXT}
+
+# History compaction: committed turns are summarized (not FIFO-evicted) once
+# they exceed this approximate token budget, preserving the cached prefix
+COMPACTION_TOKEN_BUDGET = 6000
+COMPACTION_KEEP_RECENT = 8  # Most recent messages left verbatim
+
+
+class PromptManager:
+    """
+    Conversation memory ordered for prompt-cache friendliness.
+
+    Requests are assembled as [static system prefix | committed history |
+    dynamic context | pending turn]. Completed user/assistant pairs move
+    from pending into committed only after the reply lands, and committed
+    is never mutated mid-turn, so consecutive requests share the longest
+    possible byte-identical prefix and keep the provider's prompt cache
+    warm.
+
+    When committed history outgrows its token budget, the oldest turns are
+    folded into a rolling summary message instead of being evicted: FIFO
+    eviction would shift every later message and zero out prefix-cache
+    overlap, while summarization leaves the tail untouched.
+    """
+
+    def __init__(self, token_budget=COMPACTION_TOKEN_BUDGET):
+        """Initialize empty committed and pending segments."""
+        self.token_budget = token_budget
+        self.summary = None  # Rolling summary of compacted turns
+        self.committed = collections.deque()
+        self.pending = []
+
+    def add_user_message(self, content):
+        """Stage the latest user message in the pending segment."""
+        self.pending.append({"role": "user", "content": content})
+
+    def build_messages(self, dynamic_context=None):
+        """
+        Assemble the messages array for an API call.
+
+        Args:
+            dynamic_context: Optional iterable of per-turn context messages,
+                inserted after committed history so they never disturb the
+                stable prefix
+
+        Returns:
+            list: Messages in [system, summary, committed, dynamic, pending]
+            order
+        """
+        messages = [SYSTEM_MESSAGE]
+        if self.summary is not None:
+            messages.append(self.summary)
+        messages.extend(self.committed)
+        if dynamic_context:
+            messages.extend(dynamic_context)
+        messages.extend(self.pending)
+        return messages
+
+    def commit_reply(self, content):
+        """Record the assistant reply and fold the finished turn into committed."""
+        self.pending.append({"role": "assistant", "content": content})
+        self.committed.extend(self.pending)
+        self.pending.clear()
+        self._compact_if_needed()
+
+    def clear(self):
+        """Forget the conversation entirely."""
+        self.summary = None
+        self.committed.clear()
+        self.pending.clear()
+
+    @staticmethod
+    def _approx_tokens(messages):
+        """Cheap token estimate (~4 characters per token)."""
+        return sum(len(message["content"]) for message in messages) // 4
+
+    def _compact_if_needed(self):
+        """Summarize the oldest committed turns once over the token budget."""
+        if self._approx_tokens(self.committed) <= self.token_budget:
+            return
+
+        surplus = len(self.committed) - COMPACTION_KEEP_RECENT
+        if surplus <= 0:
+            return
+
+        oldest = [self.committed.popleft() for _ in range(surplus)]
+        summary_text = self._summarize(oldest)
+
+        if summary_text:
+            self.summary = {"role": "system",
+                            "content": f"Prior conversation summary: {summary_text}"}
+            logger.info("🧠 Compacted %d history messages into a summary", surplus)
+        else:
+            # Summarization failed; restore the turns rather than lose them
+            self.committed.extendleft(reversed(oldest))
+
+    def _summarize(self, messages):
+        """
+        Summarize old turns with a cheap model call.
+
+        Args:
+            messages: Message dicts being compacted
+
+        Returns:
+            str or None: Summary text, or None if the call failed
+        """
+        lines = []
+        if self.summary is not None:
+            lines.append(self.summary["content"])
+        lines.extend(f"{message['role']}: {message['content']}" for message in messages)
+
+        try:
+            response = client.chat.completions.create(
+                model=GPT_MODEL,
+                messages=[
+                    {"role": "system",
+                     "content": ("Summarize this conversation excerpt in a short paragraph, "
+                                 "preserving names, decisions, and user preferences.")},
+                    {"role": "user", "content": "\n".join(lines)}
+                ],
+                max_tokens=200,
+                temperature=0.0
+            )
+            return response.choices[0].message.content
+
+        except Exception as e:
+            logger.warning("⚠️ History compaction failed: %s", e)
+            return None
+
 
 # Conversation memory for context continuity
-conversation_history = []
+prompt_manager = PromptManager()
 
 # Command lists for easier maintenance
 END_CONVERSATION_COMMANDS = ["exit", "quit", "goodbye", "stop assistant", "shut down"]
 SPECIAL_COMMANDS = ["pause", "resume", "clear", "web", "search"]
 
+# Special-command triggers grouped by action. Matching happens in a single
+# precompiled-regex scan instead of one substring search per phrase; longer
+# phrases are tried first so "open google" beats the bare "google" trigger.
+COMMAND_ACTIONS = {
+    # Single-word exits are matched as whole tokens (see _END_TOKEN_SET);
+    # only multi-word exit phrases go through the pattern scan
+    "exit": [phrase for phrase in END_CONVERSATION_COMMANDS if " " in phrase],
+    "pause": ["stop listening", "pause"],
+    "resume": ["start listening", "resume"],
+    "clear": ["clear conversation", "forget conversation", "start over"],
+    "open_google": ["open google", "open chrome"],
+    "open_youtube": ["open youtube"],
+    "search": ["search for", "google"],
+}
+_PHRASE_TO_ACTION = {
+    phrase: action
+    for action, phrases in COMMAND_ACTIONS.items()
+    for phrase in phrases
+}
+_COMMAND_PATTERN = re.compile(
+    "|".join(re.escape(phrase) for phrase in sorted(_PHRASE_TO_ACTION, key=len, reverse=True))
+)
+
+# Single-word exit commands checked by O(1) set membership on the tokenized
+# command, so "quit" only triggers on the whole word (not inside "mosquito")
+_END_TOKEN_SET = frozenset(word for word in END_CONVERSATION_COMMANDS if " " not in word)
+
+# Tokenizer for the exit check: Whisper emits punctuated text ("Goodbye."),
+# so tokens are extracted as letter runs rather than split on whitespace
+_WORD_TOKENS = re.compile(r"[a-z]+")
+
+# Single-pass cleanup pattern for extracting the city from weather commands
+_CITY_STRIP = re.compile(r'\s+(please|today)\b')
+
+# Platform URL opener resolved once at import; webbrowser.open can block for
+# hundreds of ms probing for the default browser on every call
+if sys.platform.startswith('linux'):
+    _OPEN_COMMAND = ['xdg-open']
+elif sys.platform == 'darwin':
+    _OPEN_COMMAND = ['open']
+elif sys.platform.startswith('win'):
+    _OPEN_COMMAND = ['cmd', '/c', 'start', '']
+else:
+    _OPEN_COMMAND = None  # Unknown platform; fall back to webbrowser
+
+
+def open_url(url):
+    """
+    Open a URL in the default browser without blocking the caller.
+
+    The platform opener is spawned fire-and-forget on a throwaway thread so
+    the spoken confirmation can play in parallel with the browser launch.
+
+    Args:
+        url (str): URL to open
+    """
+    def _open():
+        try:
+            if _OPEN_COMMAND is not None:
+                subprocess.Popen(_OPEN_COMMAND + [url],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                webbrowser.open(url)
+        except Exception as e:
+            logger.error("❌ Could not open browser: %s", e)
+
+    threading.Thread(target=_open, daemon=True).start()
+
+
+# Shared HTTP session for weather calls: keep-alive reuses the TLS connection
+# to api.openweathermap.org instead of re-handshaking on every query
+HTTP = requests.Session()
+HTTP.mount('https://', HTTPAdapter(
+    pool_connections=1,  # Only one host (openweathermap) is ever contacted
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+# Weather responses are reused within this window; the chat-scale answer
+# doesn't change minute to minute
+WEATHER_TTL_SECONDS = 300
+
+# Prebound formatter for the spoken weather summary
+_WEATHER_TEMPLATE = ("The weather in {city} is {desc} with a temperature "
+                     "of {temp:.1f}°F, feels like {feels_like:.1f}°F. "
+                     "Humidity is {humidity}%.").format
+
+
+@functools.lru_cache(maxsize=64)
+def _weather_cached(city, bucket):
+    """
+    Fetch and format weather for a city, memoized per 5-minute time bucket.
+
+    Only successful fetches are memoized: failures raise, which lru_cache
+    does not record, so a transient outage is retried on the next query
+    instead of pinning an apology for the rest of the bucket.
+
+    Args:
+        city (str): City name for the weather query
+        bucket (int): time.time() // WEATHER_TTL_SECONDS, so cached answers
+            expire naturally as the bucket rolls over
+
+    Returns:
+        str: Formatted weather information
+
+    Raises:
+        LookupError: The API returned a non-200 response for the city
+        requests.exceptions.RequestException: The request itself failed
+    """
+    base_url = "https://api.openweathermap.org/data/2.5/weather"
+    params = {
+        'q': city,
+        'appid': WEATHER_API_KEY,
+        'units': 'imperial'  # Use Fahrenheit
+    }
+
+    response = HTTP.get(base_url, params=params, timeout=(2, 5))
+
+    if response.status_code != 200:
+        raise LookupError(f"weather API returned {response.status_code} for {city!r}")
+
+    weather_data = orjson.loads(response.content)
+    main = weather_data['main']
+    weather = weather_data['weather'][0]
+
+    return _WEATHER_TEMPLATE(
+        city=city,
+        desc=weather['description'],
+        temp=main['temp'],
+        feels_like=main['feels_like'],
+        humidity=main['humidity']
+    )
+
+
+# Startup greeting
+GREETING_MESSAGE = ("Hello! I'm your conversational assistant. "
+                    "I love to chat about anything and everything! "
+                    "What's on your mind today?")
+
+# Short acknowledgements spoken only when the LLM's first token is slow to
+# arrive, so the user isn't left in silence; skipped entirely on fast turns
+FILLER_PHRASES = ["Hmm, one sec.", "Let me think.", "One moment."]
+FILLER_DELAY = 0.3  # Seconds of first-token silence before a filler plays
+
+# Fixed phrases pre-synthesized to WAV at startup so replaying them costs
+# milliseconds instead of a full pyttsx3 synthesis pass
+TTS_CACHE_DIR = "tts_cache"
+
+# Most utterances the TTS worker may fall behind before enqueueing blocks
+TTS_QUEUE_MAX = 8
+CANNED_PHRASES = [
+    GREETING_MESSAGE,
+    "It was great talking with you! Goodbye!",
+    "I'll pause for a moment. Say 'start listening' when you're ready to chat again.",
+    "I'm back! What would you like to talk about?",
+    "Fresh start! I've cleared our conversation. What's on your mind?",
+    "Opening Google for you!",
+    "Opening YouTube! Enjoy!",
+] + FILLER_PHRASES
+
+
+class SemanticCache:
+    """
+    Semantic response cache that short-circuits repeated questions.
+
+    User utterances are embedded once and compared against previously cached
+    prompts via cosine similarity (a single matrix-vector product over
+    L2-normalized vectors). Paraphrases of an earlier question ("what's the
+    weather like" vs "how's the weather") hit the cache and skip the OpenAI
+    round-trip entirely. Entries are additionally keyed on a hash of the
+    recent conversation turns so answers stay context-appropriate.
+    """
+
+    # Initial row capacity; the matrices double when full so appends are
+    # amortized O(1) instead of a full vstack copy per entry
+    INITIAL_CAPACITY = 64
+
+    def __init__(self, threshold=CACHE_SIMILARITY_THRESHOLD):
+        """Initialize an empty cache."""
+        self.threshold = threshold
+        self._size = 0
+        self._capacity = self.INITIAL_CAPACITY
+        self.embeddings = np.empty((self._capacity, EMBEDDING_DIM), dtype=np.float32)
+        self.responses = []
+        self.context_keys = []
+
+        # LRU bookkeeping: entries least recently hit are evicted once the
+        # cache exceeds CACHE_MAX_ENTRIES
+        self._last_used = []
+        self._tick = 0
+
+        # PCA compression: search runs over projected vectors once the cache
+        # is large enough; full-dimension vectors are kept only for refits
+        self.pca = None
+        self._raw_embeddings = np.empty((self._capacity, EMBEDDING_DIM), dtype=np.float32)
+        self._next_pca_fit = PCA_MIN_ENTRIES
+
+        # Store-side entries are appended in batches off the hot path
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._flush_timer = None
+
+    @staticmethod
+    def context_key(history):
+        """
+        Hash the last two conversation turns so cached answers are only
+        reused in a similar conversational context.
+
+        Args:
+            history: Sequence of {"role", "content"} message dicts
+
+        Returns:
+            str: Hex digest identifying the recent context
+        """
+        recent = list(history)[-2:]
+        digest = hashlib.sha1()
+        for message in recent:
+            digest.update(message["content"].encode("utf-8"))
+        return digest.hexdigest()
+
+    def embed(self, text):
+        """
+        Embed text into a unit-length float32 vector.
+
+        Args:
+            text (str): Text to embed
+
+        Returns:
+            numpy.ndarray or None: Normalized embedding, or None on API failure
+        """
+        try:
+            result = client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            vector = np.asarray(result.data[0].embedding, dtype=np.float32)
+            vector /= np.linalg.norm(vector)
+            return vector
+
+        except Exception as e:
+            logger.warning("⚠️ Embedding request failed, skipping cache: %s", e)
+            return None
+
+    def lookup(self, embedding, context_key):
+        """
+        Find a cached response semantically similar to the query.
+
+        Args:
+            embedding (numpy.ndarray): Normalized query embedding
+            context_key (str): Hash of the recent conversation context
+
+        Returns:
+            str or None: Cached response if similarity exceeds the threshold
+        """
+        if embedding is None:
+            return None
+
+        with self._lock:
+            if self._size == 0:
+                return None
+
+            # Single BLAS matrix-vector product over the live rows
+            similarities = self.embeddings[:self._size] @ self._project(embedding)
+            best = int(similarities.argmax())
+
+            self._tick += 1
+
+            if similarities[best] > self.threshold and self.context_keys[best] == context_key:
+                logger.info("💾 Semantic cache hit (similarity %.3f)", similarities[best])
+                self._last_used[best] = self._tick
+                return self.responses[best]
+
+        return None
+
+    def store(self, text, response, context_key, embedding=None):
+        """
+        Queue a prompt/response pair for caching. Entries are appended in
+        batches (flushed when 8 accumulate or after a short debounce) so the
+        per-turn hot path never pays for store-side work, and any entries
+        still needing an embedding share a single batched API call.
+
+        Args:
+            text (str): User prompt being cached
+            response (str): AI-generated response to cache
+            context_key (str): Hash of the recent conversation context
+            embedding (numpy.ndarray, optional): Prompt embedding if already
+                computed during lookup; embedded in the next batch otherwise
+        """
+        with self._lock:
+            self._pending.append((text, response, context_key, embedding))
+
+            # A full batch flushes immediately, but still on a timer thread:
+            # store() runs on the event loop, which must never pay for the
+            # batched embedding call or a PCA refit
+            if len(self._pending) >= EMBED_BATCH_SIZE:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                self._flush_timer = threading.Timer(0, self._flush_pending)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(EMBED_FLUSH_DELAY, self._flush_pending)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_pending(self):
+        """Embed any batch entries missing vectors and append them at once."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            batch = list(self._pending)
+            self._pending.clear()
+
+        if not batch:
+            return
+
+        # One batched embeddings request covers every entry that was cached
+        # without a usable lookup-time embedding
+        missing = [text for text, _, _, embedding in batch if embedding is None]
+        embedded = {}
+        if missing:
+            try:
+                result = client.embeddings.create(model=EMBEDDING_MODEL, input=missing)
+                for text, item in zip(missing, result.data):
+                    vector = np.asarray(item.embedding, dtype=np.float32)
+                    vector /= np.linalg.norm(vector)
+                    embedded[text] = vector
+            except Exception as e:
+                logger.warning("⚠️ Batch embedding failed, dropping %d cache entries: %s", len(missing), e)
+
+        with self._lock:
+            for text, response, context_key, embedding in batch:
+                if embedding is None:
+                    embedding = embedded.get(text)
+                if embedding is None:
+                    continue
+
+                self._append_row(embedding)
+                self.responses.append(response)
+                self.context_keys.append(context_key)
+                self._last_used.append(self._tick)
+
+            # Evict the least-recently-hit entries beyond the size cap by
+            # shifting later rows up in place
+            while self._size > CACHE_MAX_ENTRIES:
+                victim = self._last_used.index(min(self._last_used))
+                self._raw_embeddings[victim:self._size - 1] = self._raw_embeddings[victim + 1:self._size]
+                self.embeddings[victim:self._size - 1] = self.embeddings[victim + 1:self._size]
+                del self.responses[victim]
+                del self.context_keys[victim]
+                del self._last_used[victim]
+                self._size -= 1
+
+            # Refit the projection every time the cache doubles in size;
+            # the schedule ends once the next fit exceeds CACHE_MAX_ENTRIES
+            if self._size >= self._next_pca_fit:
+                self._fit_pca()
+
+    def _append_row(self, embedding):
+        """Write an embedding into the next free row, growing if needed."""
+        if self._size == self._capacity:
+            self._capacity *= 2
+            for name in ("embeddings", "_raw_embeddings"):
+                old = getattr(self, name)
+                grown = np.empty((self._capacity, old.shape[1]), dtype=np.float32)
+                grown[:self._size] = old[:self._size]
+                setattr(self, name, grown)
+
+        self._raw_embeddings[self._size] = embedding
+        self.embeddings[self._size] = self._project(embedding)
+        self._size += 1
+
+    def _project(self, vector):
+        """Project an embedding through the fitted PCA, re-normalized."""
+        if self.pca is None:
+            return vector
+
+        projected = self.pca.transform(vector[None])[0].astype(np.float32)
+        projected /= np.linalg.norm(projected)
+        return projected
+
+    def _fit_pca(self):
+        """
+        Fit PCA on the full-dimension embeddings and compress the search
+        matrix. Search time is proportional to embedding dimensionality, so
+        projecting 1536-dim vectors down to 128 dims cuts lookup cost ~12x
+        once the cache grows to hundreds of entries.
+        """
+        self.pca = PCA(n_components=PCA_COMPONENTS)
+        projected = self.pca.fit_transform(self._raw_embeddings[:self._size]).astype(np.float32)
+        projected /= np.linalg.norm(projected, axis=1, keepdims=True)
+
+        # The search matrix shrinks to the compressed width at full capacity
+        self.embeddings = np.empty((self._capacity, PCA_COMPONENTS), dtype=np.float32)
+        self.embeddings[:self._size] = projected
+        self._next_pca_fit = self._size * 2
+        logger.info("💾 Semantic cache compressed to %d dims at %d entries", PCA_COMPONENTS, self._size)
+
+
+# Shared response cache for the assistant session
+semantic_cache = SemanticCache()
+
 
 class TTSEngine:
     """
     Text-to-Speech engine class.
+
+    A single pyttsx3 engine lives on a dedicated daemon thread that services
+    a queue of utterances. Keeping the engine alive across turns (instead of
+    sleeping around runAndWait) avoids the pyttsx3 hang bug without blocking
+    the assistant for tens of seconds per response.
     """
-    
+
+    # pyttsx3.init() loads the platform speech driver (SAPI/NSSpeech/eSpeak),
+    # which costs hundreds of milliseconds and can leak driver handles if
+    # repeated; one engine is shared for the life of the process
+    _shared_engine = None
+    _voice_configured = False
+
     def __init__(self):
-        """Initialize the TTS engine."""
-        self.engine = pyttsx3.init()
-        self._configure_voice()
-    
+        """Initialize the TTS engine and start the speech worker thread."""
+        if TTSEngine._shared_engine is None:
+            TTSEngine._shared_engine = pyttsx3.init()
+        self.engine = TTSEngine._shared_engine
+
+        # Enumerating driver voices walks the platform voice registry, which
+        # is slow on some backends; configure the shared engine exactly once
+        if not TTSEngine._voice_configured:
+            self._configure_voice()
+            TTSEngine._voice_configured = True
+
+        # Pre-synthesize fixed phrases so they replay from WAV files
+        self._mixer_ready = self._init_mixer()
+        self._prepare_canned_phrases()
+
+        # Queue of (text, done_event) pairs serviced by the worker thread;
+        # the speaking flag is set while any utterance is playing. The bound
+        # applies backpressure: once playback falls this many utterances
+        # behind, producers wait instead of buffering minutes of speech
+        self._queue = queue.Queue(maxsize=TTS_QUEUE_MAX)
+        self.speaking = threading.Event()
+        self._worker = threading.Thread(target=self._speech_worker, daemon=True)
+        self._worker.start()
+
+    @staticmethod
+    def _init_mixer():
+        """Initialize the pygame mixer used to replay cached WAV phrases."""
+        try:
+            pygame.mixer.init()
+            return True
+        except Exception as e:
+            logger.warning("⚠️ Audio mixer unavailable, canned phrases disabled: %s", e)
+            return False
+
+    @staticmethod
+    def _cache_path(text):
+        """Return the WAV cache path for a phrase, keyed by content hash."""
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        return os.path.join(TTS_CACHE_DIR, f"{digest}.wav")
+
+    def _prepare_canned_phrases(self):
+        """Synthesize any missing canned phrases to the WAV cache once."""
+        if not self._mixer_ready:
+            return
+
+        try:
+            os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+            missing = [(text, self._cache_path(text)) for text in CANNED_PHRASES]
+            missing = [(text, path) for text, path in missing if not os.path.exists(path)]
+
+            if missing:
+                for text, path in missing:
+                    self.engine.save_to_file(text, path)
+                self.engine.runAndWait()
+                logger.info("✅ Pre-synthesized %d canned phrases", len(missing))
+
+        except Exception as e:
+            logger.warning("⚠️ Could not pre-synthesize canned phrases: %s", e)
+
+    def _play_cached(self, text):
+        """
+        Replay a pre-synthesized WAV for the text if one exists.
+
+        Args:
+            text (str): Phrase to play
+
+        Returns:
+            bool: True if the cached WAV was played
+        """
+        if not self._mixer_ready:
+            return False
+
+        path = self._cache_path(text)
+        if not os.path.exists(path):
+            return False
+
+        try:
+            channel = pygame.mixer.Sound(path).play()
+            while channel is not None and channel.get_busy():
+                pygame.time.wait(50)
+            return True
+
+        except Exception as e:
+            logger.warning("⚠️ Cached phrase playback failed: %s", e)
+            return False
+
     def _configure_voice(self):
         """Configure voice properties for better speech quality."""
         voices = self.engine.getProperty('voices')
@@ -61,26 +806,49 @@ class TTSEngine:
         # Set volume (0.0 to 1.0)
         self.engine.setProperty('volume', 0.9)
     
+    def _speech_worker(self):
+        """Worker loop: pull utterances off the queue and speak them."""
+        while True:
+            text, done_event = self._queue.get()
+            self.speaking.set()
+            try:
+                # Canned phrases replay from WAV; only novel text is synthesized
+                if not self._play_cached(text):
+                    self.engine.say(text)
+                    self.engine.runAndWait()
+                logger.info("✅ Text-to-speech completed successfully")
+            except Exception as e:
+                logger.error("❌ TTS error: %s", e)
+            finally:
+                done_event.set()
+                self._queue.task_done()
+                if self._queue.empty():
+                    self.speaking.clear()
+
     def speak(self, text):
         """
-        Convert text to speech with bug mitigation.
-        
+        Convert text to speech, blocking until the utterance finishes.
+
         Args:
             text (str): Text to be spoken
         """
-        try:
-            self.engine.say(text)
-            
-            # Sleep for xx seconds post response. else AI does not respond (pyaudio didn't help either)
-            # (reference: https://stackoverflow.com/questions/56032027/pyttsx3-runandwait-method-gets-stuck/57181260#57181260)
-            if "Hello!" not in text:
-                time.sleep(25)
-            
-            self.engine.runAndWait()
-            logging.info("✅ Text-to-speech completed successfully")
-            
-        except Exception as e:
-            logging.error(f"❌ TTS error: {e}")
+        done_event = threading.Event()
+        self._queue.put((text, done_event))
+        done_event.wait()
+
+    def speak_async(self, text):
+        """
+        Queue text for speech without waiting for it to finish, so the
+        caller can return to listening while the utterance plays.
+
+        Args:
+            text (str): Text to be spoken
+        """
+        self._queue.put((text, threading.Event()))
+
+    def wait_until_quiet(self):
+        """Block until every queued utterance has finished playing."""
+        self._queue.join()
 
 
 class ConversationalAssistant:
@@ -94,228 +862,488 @@ class ConversationalAssistant:
         self.microphone = sr.Microphone()
         self.is_listening = True
         self.tts = TTSEngine()
+        self._asr_backend, self._local_asr = self._load_local_asr()
         
         # Configure speech recognition sensitivity
         self.recognizer.energy_threshold = 4000
         self.recognizer.dynamic_energy_threshold = True
-        
-        # Calibrate microphone for ambient noise
-        self._calibrate_microphone()
+
+        # Tighten endpointing: the default 0.8s pause threshold adds most of
+        # a second of dead air to every turn before recognition even starts.
+        # 0.5s still tolerates natural mid-sentence pauses, and the Whisper
+        # backend's VAD filter cleans up anything the energy gate lets through
+        self.recognizer.pause_threshold = 0.5
+        self.recognizer.non_speaking_duration = 0.3
+
+        # The PyAudio stream stays open for the life of the assistant;
+        # re-opening it per turn costs tens of milliseconds of driver setup.
+        # The lock serializes the lazy open across the calibration, listen
+        # and resume-listener threads
+        self._mic_source = None
+        self._mic_lock = threading.Lock()
+
+        # Set while the assistant should be listening; the main loop blocks
+        # on this instead of polling the microphone while paused
+        self._resume_evt = threading.Event()
+        self._resume_evt.set()
+
+        # Calibrate microphone for ambient noise in the background so the
+        # greeting isn't delayed; the first listen joins on it
+        self._failed_recognitions = 0
+        self._calibration_thread = threading.Thread(target=self._calibrate_microphone, daemon=True)
+        self._calibration_thread.start()
     
+    def _load_local_asr(self):
+        """
+        Load the best available local ASR model.
+
+        Local recognition runs on-device, cutting the multi-second HTTPS
+        round-trip to Google's speech API out of every turn. faster-whisper
+        is tried first (int8 quantization keeps it real-time on CPU), then
+        Vosk as the lighter fallback.
+
+        Returns:
+            tuple: (backend name, model), or (None, None) to use cloud ASR
+        """
+        if WhisperModel is not None:
+            try:
+                model = WhisperModel("small.en", device="cpu", compute_type="int8")
+                logger.info("✅ Local faster-whisper ASR model loaded")
+                return "whisper", model
+            except Exception as e:
+                logger.warning("⚠️ Could not load faster-whisper model: %s", e)
+
+        if vosk is not None:
+            try:
+                model = vosk.Model(lang="en-us")
+                logger.info("✅ Local Vosk ASR model loaded")
+                return "vosk", model
+            except Exception as e:
+                logger.warning("⚠️ Could not load Vosk model, using Google ASR: %s", e)
+
+        return None, None
+
+    def _recognize(self, audio):
+        """
+        Transcribe captured audio, locally when a model is loaded.
+
+        Args:
+            audio (sr.AudioData): Captured audio
+
+        Returns:
+            str or None: Recognized text, or None if nothing was understood
+        """
+        if self._asr_backend == "whisper":
+            raw = audio.get_raw_data(convert_rate=ASR_SAMPLE_RATE, convert_width=2)
+            samples = np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+
+            # The built-in VAD filter drops non-speech segments before decode
+            segments, _ = self._local_asr.transcribe(samples, vad_filter=True, beam_size=1)
+            text = " ".join(segment.text.strip() for segment in segments)
+            return text or None
+
+        if self._asr_backend == "vosk":
+            raw = audio.get_raw_data(convert_rate=ASR_SAMPLE_RATE, convert_width=2)
+            local_recognizer = vosk.KaldiRecognizer(self._local_asr, ASR_SAMPLE_RATE)
+
+            # Feed the recognizer in 100ms frames the way a live stream
+            # would, instead of one monolithic blob
+            for offset in range(0, len(raw), ASR_CHUNK_BYTES):
+                local_recognizer.AcceptWaveform(raw[offset:offset + ASR_CHUNK_BYTES])
+
+            text = json.loads(local_recognizer.FinalResult()).get("text", "")
+            return text or None
+
+        # Fall back to Google Web Speech (network round-trip)
+        return self.recognizer.recognize_google(audio)
+
+    def _open_microphone(self):
+        """
+        Open the persistent microphone stream on first use and return it.
+
+        Returns:
+            sr.Microphone: The opened microphone source
+        """
+        with self._mic_lock:
+            if self._mic_source is None:
+                self._mic_source = self.microphone.__enter__()
+            return self._mic_source
+
+    def close(self):
+        """Release the persistent microphone stream."""
+        with self._mic_lock:
+            if self._mic_source is not None:
+                self._mic_source = None
+                self.microphone.__exit__(None, None, None)
+
     def _calibrate_microphone(self):
         """Calibrate microphone for ambient noise on startup."""
         try:
-            with self.microphone as source:
-                logging.info("🎤 Calibrating microphone for ambient noise...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=1.5)
-                logging.info("✅ Microphone calibrated successfully")
+            source = self._open_microphone()
+            logger.info("🎤 Calibrating microphone for ambient noise...")
+            self.recognizer.adjust_for_ambient_noise(source, duration=1.5)
+            logger.info("✅ Microphone calibrated successfully")
         except Exception as e:
-            logging.error(f"❌ Microphone calibration failed: {e}")
-    
+            logger.error("❌ Microphone calibration failed: %s", e)
+
+    # Consecutive failed recognitions that trigger a quick re-calibration
+    RECALIBRATE_AFTER_FAILURES = 3
+
+    def _note_recognition_failure(self):
+        """Re-calibrate briefly after several failed recognitions in a row."""
+        self._failed_recognitions += 1
+        if self._failed_recognitions < self.RECALIBRATE_AFTER_FAILURES:
+            return
+
+        self._failed_recognitions = 0
+        try:
+            self.recognizer.adjust_for_ambient_noise(self._open_microphone(), duration=0.3)
+            logger.info("🎤 Re-calibrated microphone after repeated failed recognitions")
+        except Exception as e:
+            logger.error("❌ Microphone re-calibration failed: %s", e)
+
     def listen_for_speech(self):
         """
         Listen for voice input from the user.
-        
+
         Returns:
             str or None: Recognized speech text, or None if no speech detected
         """
+        # Make sure the startup calibration has finished before first capture
+        if self._calibration_thread is not None:
+            self._calibration_thread.join(timeout=3)
+            self._calibration_thread = None
+
+        # Suppress the mic while the assistant is still speaking so it
+        # doesn't transcribe its own voice. The wait is unconditional:
+        # queue.join() returns immediately when idle and, unlike the
+        # speaking flag, also covers utterances queued but not yet started
+        self.tts.wait_until_quiet()
+
         try:
-            with self.microphone as source:
-                logging.info("🎧 Listening for speech...")
-                
-                # Listen with timeout to prevent hanging
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=7,  # Stop listening after x seconds of silence
-                    phrase_time_limit=45  # Maximum phrase duration
-                )
-                
-                # Convert audio to text using Google Speech Recognition
-                try:
-                    command = self.recognizer.recognize_google(audio)
-                    logging.info(f"👤 User said: {command}")
-                    return command.lower()
-                    
-                except sr.UnknownValueError:
-                    logging.warning("⚠️ Could not understand audio")
-                    return None
-                    
-                except sr.RequestError as e:
-                    logging.error(f"❌ Speech recognition service error: {e}")
+            # The stream is already open; entering it per turn would re-prime
+            # the PortAudio buffers on every listen
+            source = self._open_microphone()
+            logger.info("🎧 Listening for speech...")
+
+            # Listen with timeout to prevent hanging; the phrase cap
+            # bounds a single capture at ~30s of PCM
+            audio = self.recognizer.listen(
+                source,
+                timeout=7,  # Stop listening after x seconds of silence
+                phrase_time_limit=MAX_PHRASE_SECONDS
+            )
+
+            # Convert audio to text (local Vosk model if loaded, else Google)
+            try:
+                command = self._recognize(audio)
+                if not command:
+                    logger.warning("⚠️ Could not understand audio")
+                    self._note_recognition_failure()
                     return None
-                    
+
+                logger.info("👤 User said: %s", command)
+                self._failed_recognitions = 0
+                return command.lower()
+
+            except sr.UnknownValueError:
+                logger.warning("⚠️ Could not understand audio")
+                self._note_recognition_failure()
+                return None
+
+            except sr.RequestError as e:
+                logger.error("❌ Speech recognition service error: %s", e)
+                return None
+
         except sr.WaitTimeoutError:
             # Normal timeout - no speech detected
             return None
             
         except Exception as e:
-            logging.error(f"❌ Microphone error: {e}")
+            logger.error("❌ Microphone error: %s", e)
             return None
     
     def get_weather_info(self, city):
         """
         Fetch weather information for a given city.
-        
+
+        Results are cached per city for 5 minutes, so a repeated question
+        answers instantly without another API round-trip.
+
         Args:
             city (str): City name for weather query
-            
+
         Returns:
             str: Weather information or error message
         """
         if not WEATHER_API_KEY:
             return ("I'd love to help with weather, but I need a weather API key. "
                    "For now, I can help with many other topics!")
-        
+
+        # Apologies are built here, outside the cache, so a failed fetch is
+        # retried on the next question instead of being memoized
         try:
-            base_url = "http://api.openweathermap.org/data/2.5/weather"
-            params = {
-                'q': city,
-                'appid': WEATHER_API_KEY,
-                'units': 'imperial'  # Use Fahrenheit
-            }
-            
-            response = requests.get(base_url, params=params, timeout=10)
-            
-            if 200 == response.status_code:
-                weather_data = response.json()
-                main = weather_data['main']
-                weather = weather_data['weather'][0]
-                
-                temperature = main['temp']
-                description = weather['description']
-                feels_like = main['feels_like']
-                humidity = main['humidity']
-                
-                return (f"The weather in {city} is {description} with a temperature "
-                       f"of {temperature:.1f}°F, feels like {feels_like:.1f}°F. "
-                       f"Humidity is {humidity}%.")
-            else:
-                return f"I couldn't get weather information for {city}. Please try another city."
-                
+            return _weather_cached(city, int(time.time() // WEATHER_TTL_SECONDS))
+
+        except LookupError:
+            return f"I couldn't get weather information for {city}. Please try another city."
+
         except requests.exceptions.RequestException as e:
-            logging.error(f"Weather API request failed: {e}")
+            logger.error("Weather API request failed: %s", e)
             return "I'm having trouble getting weather info right now, but I'm here to chat about anything else!"
-        
+
         except Exception as e:
-            logging.error(f"Weather function error: {e}")
+            logger.error("Weather function error: %s", e)
             return "Weather service is temporarily unavailable, but I can help with other topics!"
     
-    def generate_ai_response(self, user_input):
+    # Characters that end a speakable sentence in a streamed completion
+    SENTENCE_BOUNDARIES = ".!?\n"
+
+    async def generate_ai_response(self, user_input):
         """
         Generate a conversational response using OpenAI's GPT.
-        
+
+        The completion is streamed over the async client, and each sentence
+        is queued to the TTS worker as soon as its boundary arrives, so the
+        assistant starts speaking after the first sentence instead of after
+        the full completion.
+
         Args:
             user_input (str): User's message
-            
+
         Returns:
-            str: AI-generated response
+            str: AI-generated response (already queued for speech)
         """
+        filler_timer = None
         try:
-            # Add user input to conversation history
-            conversation_history.append({"role": "user", "content": user_input})
-            
-            # Maintain conversation history size (keep last 20 messages)
-            if len(conversation_history) > 20:
-                conversation_history.pop(0)
-            
-            # System message to define AI personality and behavior
-            system_message = {
-                "role": "system", 
-                "content": """You are a friendly, helpful, and conversational voice assistant. 
-                
-                Key traits:
-                - Be natural and conversational, like talking to a friend
-                - Keep responses concise but informative (1-3 sentences usually)
-                - Show personality and enthusiasm when appropriate
-                - Ask follow-up questions to keep conversation flowing
-                - Be helpful with any topic: science, history, math, advice, entertainment, etc.
-                - If you don't know something recent, acknowledge it but still try to help
-                - Remember the conversation context from previous messages
-                - Be encouraging and positive
-                - Always provide a meaningful response
-                - Respond naturally as if you're having a real conversation
-                - Avoid overly long responses since this is voice-based interaction"""
-            }
-            
-            # Create messages array with system message and conversation history
-            messages = [system_message] + conversation_history
+            # Check the semantic cache before paying for an OpenAI round-trip
+            context_key = semantic_cache.context_key(prompt_manager.committed)
+            embedding = await asyncio.to_thread(semantic_cache.embed, user_input)
+            cached_response = semantic_cache.lookup(embedding, context_key)
+
+            if cached_response is not None:
+                prompt_manager.add_user_message(user_input)
+                # commit_reply can trigger a compaction round-trip, so keep
+                # it off the event loop even on the cache-hit fast path
+                await asyncio.to_thread(prompt_manager.commit_reply, cached_response)
+                self.tts.speak_async(cached_response)
+                return cached_response
+
+            # Stage the user message; it only joins committed history once
+            # the reply lands, so the stable prefix never shifts mid-turn
+            prompt_manager.add_user_message(user_input)
+            messages = prompt_manager.build_messages()
             
-            # Generate response using OpenAI API
-            response = client.chat.completions.create(
+            # The cache missed, so a network round-trip is coming: arm a
+            # filler acknowledgement that only plays if the first token
+            # hasn't arrived after FILLER_DELAY
+            filler_timer = threading.Timer(
+                FILLER_DELAY, self.tts.speak_async, args=(random.choice(FILLER_PHRASES),)
+            )
+            filler_timer.daemon = True
+            filler_timer.start()
+
+            # Generate response using the OpenAI API, streamed so speech can
+            # begin at the first sentence boundary
+            stream = await aclient.chat.completions.create(
                 model=GPT_MODEL,
                 messages=messages,
                 max_tokens=MAX_TOKENS,
-                temperature=TEMPERATURE
+                temperature=TEMPERATURE,
+                stop=COMPLETION_STOP,
+                stream=True
             )
-            
-            ai_response = response.choices[0].message.content
-            
-            # Add AI response to conversation history
-            conversation_history.append({"role": "assistant", "content": ai_response})
-            
-            logging.info(f"🤖 AI Response: {ai_response}")
+
+            segments = []
+            buffer = ""
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+
+                # First token made it in time; the filler isn't needed
+                filler_timer.cancel()
+
+                buffer += delta
+
+                # Queue every completed sentence for speech immediately
+                boundary = max(buffer.rfind(ch) for ch in self.SENTENCE_BOUNDARIES)
+                if boundary != -1:
+                    segment, buffer = buffer[:boundary + 1], buffer[boundary + 1:]
+                    segments.append(segment)
+                    if segment.strip():
+                        self.tts.speak_async(segment.strip())
+
+            # Flush whatever trails the last sentence boundary
+            if buffer:
+                segments.append(buffer)
+                if buffer.strip():
+                    self.tts.speak_async(buffer.strip())
+
+            ai_response = "".join(segments)
+
+            # Fold the completed user/assistant pair into committed history
+            # (may trigger a compaction call, so keep it off the event loop)
+            await asyncio.to_thread(prompt_manager.commit_reply, ai_response)
+
+            # Cache the response for future semantically similar questions
+            semantic_cache.store(user_input, ai_response, context_key, embedding=embedding)
+
+            logger.info("🤖 AI Response: %s", ai_response)
             return ai_response
             
         except Exception as e:
-            logging.error(f"❌ Error getting AI response: {e}")
-            return ("I'm having a little trouble right now, but I'm still here to chat! "
-                   "Try asking me something else.")
+            # Make sure a pending filler doesn't play right before the
+            # error fallback if the request or the stream failed
+            if filler_timer is not None:
+                filler_timer.cancel()
+
+            logger.error("❌ Error getting AI response: %s", e)
+            fallback = ("I'm having a little trouble right now, but I'm still here to chat! "
+                        "Try asking me something else.")
+            await asyncio.to_thread(prompt_manager.commit_reply, fallback)
+            self.tts.speak_async(fallback)
+            return fallback
     
+    async def _weather_small_talk(self, command):
+        """
+        Generate a one-sentence conversational aside for a weather query,
+        in parallel with the weather API fetch.
+
+        Args:
+            command (str): User's weather command
+
+        Returns:
+            str or None: Friendly follow-up sentence, or None on failure so
+            the factual weather answer still stands alone
+        """
+        try:
+            response = await aclient.chat.completions.create(
+                model=GPT_MODEL,
+                messages=[
+                    SYSTEM_MESSAGE,
+                    {"role": "user", "content": command},
+                    {"role": "system",
+                     "content": ("Reply with one short, friendly sentence reacting to the "
+                                 "user's weather question. Do not invent weather data.")}
+                ],
+                max_tokens=40,
+                temperature=TEMPERATURE
+            )
+            return response.choices[0].message.content
+
+        except Exception as e:
+            logger.warning("⚠️ Weather small talk failed: %s", e)
+            return None
+
+    def _handle_exit(self, command, match=None):
+        """Say goodbye and signal the main loop to stop."""
+        self.tts.speak("It was great talking with you! Goodbye!")
+        return "exit"
+
+    def _handle_pause(self, command, match=None):
+        """Pause listening until a resume command arrives."""
+        self.tts.speak("I'll pause for a moment. Say 'start listening' when you're ready to chat again.")
+        self.is_listening = False
+        self._resume_evt.clear()
+        threading.Thread(target=self._resume_listener, daemon=True).start()
+        return "pause"
+
+    def _handle_resume(self, command, match=None):
+        """Resume listening after a pause."""
+        self.tts.speak("I'm back! What would you like to talk about?")
+        self.is_listening = True
+        self._resume_evt.set()
+        return "resume"
+
+    # Phrases that wake the assistant out of a pause
+    RESUME_PHRASES = ("start listening", "resume")
+
+    def _resume_listener(self):
+        """
+        Watch for a resume phrase while the assistant is paused.
+
+        Resume phrases are a couple of words, so captures are capped at a
+        few seconds instead of the full turn limit. The main loop sleeps on
+        the resume event the whole time, so pausing costs no polling there.
+        """
+        source = self._open_microphone()
+        while not self._resume_evt.is_set():
+            try:
+                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=4)
+                heard = self._recognize(audio)
+            except sr.WaitTimeoutError:
+                continue
+            except Exception:
+                continue
+
+            if heard and any(phrase in heard.lower() for phrase in self.RESUME_PHRASES):
+                self._handle_resume(heard.lower())
+
+    def _handle_clear(self, command, match=None):
+        """Clear the conversation history."""
+        prompt_manager.clear()
+        self.tts.speak("Fresh start! I've cleared our conversation. What's on your mind?")
+        return "clear"
+
+    def _handle_open_google(self, command, match=None):
+        """Open Google in the default browser."""
+        self.tts.speak("Opening Google for you!")
+        open_url('https://google.com')
+        return "web"
+
+    def _handle_open_youtube(self, command, match=None):
+        """Open YouTube in the default browser."""
+        self.tts.speak("Opening YouTube! Enjoy!")
+        open_url('https://youtube.com')
+        return "web"
+
+    def _handle_search(self, command, match=None):
+        """Run a Google search for the query embedded in the command."""
+        # The query is whatever follows the trigger phrase; quote_plus
+        # escapes it correctly (e.g. "&" in "tom & jerry")
+        query = command[match.end():].strip() if match else command.strip()
+        if query:
+            search_url = "https://google.com/search?q=" + quote_plus(query)
+            self.tts.speak(f"Searching for {query}! Here you go.")
+            open_url(search_url)
+            return "search"
+
+        return None  # Matched phrase had nothing actionable (empty search)
+
+    # O(1) dispatch from matched action ID to its handler
+    _COMMAND_HANDLERS = {
+        "exit": _handle_exit,
+        "pause": _handle_pause,
+        "resume": _handle_resume,
+        "clear": _handle_clear,
+        "open_google": _handle_open_google,
+        "open_youtube": _handle_open_youtube,
+        "search": _handle_search,
+    }
+
     def handle_special_commands(self, command):
         """
         Process special voice commands that aren't general conversation.
-        
+
         Args:
             command (str): User's voice command
-            
+
         Returns:
             str or None: Command result ("exit", "pause", etc.) or None if not a special command
         """
-        # Exit commands
-        if any(word in command for word in END_CONVERSATION_COMMANDS):
-            self.tts.speak("It was great talking with you! Goodbye!")
-            return "exit"
-        
-        # Pause listening
-        elif any(phrase in command for phrase in ["stop listening", "pause"]):
-            self.tts.speak("I'll pause for a moment. Say 'start listening' when you're ready to chat again.")
-            self.is_listening = False
-            return "pause"
-        
-        # Resume listening  
-        elif any(phrase in command for phrase in ["start listening", "resume"]):
-            self.tts.speak("I'm back! What would you like to talk about?")
-            self.is_listening = True
-            return "resume"
-        
-        # Clear conversation history
-        elif any(phrase in command for phrase in ["clear conversation", "forget conversation", "start over"]):
-            conversation_history.clear()
-            self.tts.speak("Fresh start! I've cleared our conversation. What's on your mind?")
-            return "clear"
-        
-        # Web browsing commands
-        elif any(phrase in command for phrase in ["open google", "open chrome"]):
-            self.tts.speak("Opening Google for you!")
-            webbrowser.open('https://google.com')
-            return "web"
-        
-        elif "open youtube" in command:
-            self.tts.speak("Opening YouTube! Enjoy!")
-            webbrowser.open('https://youtube.com')
-            return "web"
-        
-        # Search commands
-        elif any(phrase in command for phrase in ["search for", "google"]):
-            # Extract search query
-            query = command.replace("search for", "").replace("google", "").strip()
-            if query:
-                search_url = f"https://google.com/search?q={query.replace(' ', '+')}"
-                self.tts.speak(f"Searching for {query}! Here you go.")
-                webbrowser.open(search_url)
-                return "search"
-        
-        return None  # Not a special command
+        # Single-word exits match on whole tokens; tokenize once, ignoring
+        # the punctuation local ASR attaches ("goodbye." still exits)
+        if not _END_TOKEN_SET.isdisjoint(_WORD_TOKENS.findall(command)):
+            return self._handle_exit(command)
+
+        # One pass over the command finds the leftmost trigger phrase
+        match = _COMMAND_PATTERN.search(command)
+        if match is None:
+            return None  # Not a special command
+
+        handler = self._COMMAND_HANDLERS[_PHRASE_TO_ACTION[match.group()]]
+        return handler(self, command, match)
     
     def process_weather_command(self, command):
         """
@@ -334,13 +1362,13 @@ class ConversationalAssistant:
             try:
                 city = command.split(" in ")[1].strip()
                 # Remove common trailing words
-                city = city.replace(" please", "").replace(" today", "")
+                city = _CITY_STRIP.sub('', city)
             except IndexError:
                 pass
         elif " for " in command:
             try:
                 city = command.split(" for ")[1].strip()
-                city = city.replace(" please", "").replace(" today", "")
+                city = _CITY_STRIP.sub('', city)
             except IndexError:
                 pass
         
@@ -348,86 +1376,159 @@ class ConversationalAssistant:
     
     def run(self):
         """Main assistant loop that handles voice interaction."""
-        
-        # Startup message
-        greeting_message = ("Hello! I'm your conversational assistant. "
-                           "I love to chat about anything and everything! "
-                           "What's on your mind today?")
-        
+
         # Display startup information
-        logging.info("🚀 Conversational Voice Assistant Starting...")
-        logging.info("💬 Ready to chat about ANY topic!")
-        logging.info("🎯 Special commands available:")
-        logging.info("  • 'Clear conversation' - Start fresh")
-        logging.info("  • 'Stop listening' - Pause assistant")
-        logging.info("  • 'Start listening' - Resume assistant")
-        logging.info("  • 'Open Google/YouTube' - Web browsing")
-        logging.info("  • 'Search for [query]' - Google search")
-        logging.info("  • 'Weather in [city]' - Weather info")
-        logging.info("  • 'Exit/Quit/Goodbye' - End session")
-        logging.info("-" * 60)
+        logger.info("🚀 Conversational Voice Assistant Starting...")
+        logger.info("💬 Ready to chat about ANY topic!")
+        logger.info("🎯 Special commands available:")
+        logger.info("  • 'Clear conversation' - Start fresh")
+        logger.info("  • 'Stop listening' - Pause assistant")
+        logger.info("  • 'Start listening' - Resume assistant")
+        logger.info("  • 'Open Google/YouTube' - Web browsing")
+        logger.info("  • 'Search for [query]' - Google search")
+        logger.info("  • 'Weather in [city]' - Weather info")
+        logger.info("  • 'Exit/Quit/Goodbye' - End session")
+        logger.info("-" * 60)
         
         # Initial greeting
-        self.tts.speak(greeting_message)
-        
-        # Main conversation loop
+        self.tts.speak(GREETING_MESSAGE)
+
+        # Main conversation loop runs as an asyncio pipeline
+        try:
+            asyncio.run(self._run_async())
+        finally:
+            self.close()
+
+    async def _run_async(self):
+        """
+        Async conversation loop.
+
+        Blocking stages (microphone capture, speech recognition, the LLM
+        round-trip) run in worker threads via asyncio.to_thread, and
+        responses are queued to the TTS worker without waiting, so the mic
+        can already be capturing the next utterance while the assistant is
+        still speaking. Turn states flow LISTENING -> THINKING -> SPEAKING
+        instead of each stage blocking the whole loop.
+        """
         while True:
             if self.is_listening:
-                # Listen for user input
-                command = self.listen_for_speech()
-                
+                # LISTENING: capture and recognize off the event loop
+                command = await asyncio.to_thread(self.listen_for_speech)
+
                 if command:
-                    logging.info(f"🎤 Processing: {command}")
-                    
+                    logger.info("🎤 Processing: %s", command)
+
                     # Check for special commands first
-                    special_result = self.handle_special_commands(command)
-                    
+                    special_result = await asyncio.to_thread(self.handle_special_commands, command)
+
                     if special_result == "exit":
                         break
                     elif special_result in SPECIAL_COMMANDS:
                         continue  # Special command was handled
-                    
-                    # Handle weather queries
+
+                    # Handle weather queries: the API fetch and the
+                    # conversational aside are independent round-trips, so
+                    # run them concurrently and pay max() instead of sum()
                     elif "weather" in command:
-                        weather_info = self.process_weather_command(command)
-                        self.tts.speak(weather_info)
-                    
+                        weather_info, small_talk = await asyncio.gather(
+                            asyncio.to_thread(self.process_weather_command, command),
+                            self._weather_small_talk(command)
+                        )
+                        self.tts.speak_async(weather_info)
+                        if small_talk:
+                            self.tts.speak_async(small_talk)
+
                     # Handle general conversation
                     else:
-                        logging.info("🤖 Generating AI response...")
-                        response = self.generate_ai_response(command)
-                        logging.info("🔊 Speaking response...")
-                        self.tts.speak(response)
-            
+                        # THINKING/SPEAKING: async streamed LLM call;
+                        # sentences reach the TTS queue as tokens arrive
+                        logger.info("🤖 Generating AI response...")
+                        await self.generate_ai_response(command)
+
             else:
-                # When paused, only listen for resume command
-                command = self.listen_for_speech()
-                if command and any(phrase in command for phrase in ["start listening", "resume"]):
-                    self.handle_special_commands(command)
+                # PAUSED: block until the resume listener sets the event;
+                # no full-turn captures or recognition happen on this path
+                await asyncio.to_thread(self._resume_evt.wait)
+
+
+def _start_warmups():
+    """
+    Warm the network paths used every turn so the first real turn matches
+    steady-state latency instead of being a cold-start outlier.
+
+    Returns:
+        list[threading.Thread]: Started warmup threads
+    """
+    def warm_weather():
+        # Establishes the TLS connection the weather session will reuse
+        try:
+            HTTP.head('https://api.openweathermap.org', timeout=1)
+        except Exception:
+            pass
+
+    def warm_chat():
+        # One throwaway token opens the OpenAI HTTPS pool
+        try:
+            client.chat.completions.create(
+                model=GPT_MODEL,
+                messages=[{"role": "user", "content": "hi"}],
+                max_tokens=1
+            )
+        except Exception:
+            pass
+
+    def warm_embeddings():
+        # Warms the embeddings endpoint used by the semantic cache
+        try:
+            semantic_cache.embed("hello")
+        except Exception:
+            pass
+
+    threads = [
+        threading.Thread(target=target, daemon=True)
+        for target in (warm_weather, warm_chat, warm_embeddings)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads
 
 
 def main():
     """Main entry point for the voice assistant."""
-    
+
     # Verify required environment variables
     if not OPENAI_KEY:
-        logging.error("❌ OPENAI_API_KEY environment variable is required")
+        logger.error("❌ OPENAI_API_KEY environment variable is required")
         print("Please set your OPENAI_API_KEY in your .env file")
         return
-    
-    # Initialize and run the assistant
+
+    # Route log writing through a listener thread so console I/O never
+    # stalls the voice loop
+    log_listener = _setup_queue_logging()
+
+    # Initialize and run the assistant (construction also preloads the TTS
+    # driver via the canned-phrase synthesis); warmups race with it
+    warmups = _start_warmups()
     assistant = ConversationalAssistant()
-    
+
+    # Give the warmups a moment to land before the first turn
+    for thread in warmups:
+        thread.join(timeout=1)
+
     try:
         assistant.run()
-        
+
     except KeyboardInterrupt:
         print("\n👋 Voice assistant ended by user")
-        logging.info("Assistant stopped by user (Ctrl+C)")
-        
+        logger.info("Assistant stopped by user (Ctrl+C)")
+
     except Exception as e:
         print(f"❌ An unexpected error occurred: {e}")
-        logging.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
+
+    finally:
+        # Flush any queued records before the process exits
+        log_listener.stop()
 
 
 if __name__ == '__main__':